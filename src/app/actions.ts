@@ -5,6 +5,18 @@ import { getAuditLog, updateAuditLog, getUserAuditLogs } from "@/lib/audit";
 import { replan } from "@/lib/planner";
 import { AuditLog } from "@/lib/types";
 
+// Error substrings that indicate a transient failure worth retrying.
+const TECHNICAL_ERROR_KEYWORDS = [
+  "429", "network", "timeout", "fetch", "socket", "hang up",
+  "overpass api error", "rate limit", "503", "502", "504",
+  "internal server error", "connection refused"
+];
+// Keywords are joined unescaped, so entries must not contain regex metacharacters
+const TECHNICAL_ERROR_PATTERN = new RegExp(TECHNICAL_ERROR_KEYWORDS.join("|"), "i");
+
+// Error substrings that classify a failed step as a validation error before re-planning.
+const VALIDATION_ERROR_PATTERN = /invalid|missing|type|validation/i;
+
 export async function executeToolWithContext(
   tool_name: string, 
   parameters: any, 
@@ -25,12 +37,7 @@ export async function executeToolWithContext(
       result = await toolDef.execute(parameters);
       
       // Technical vs Logical error detection
-      const technicalErrorKeywords = [
-        "429", "network", "timeout", "fetch", "socket", "hang up", 
-        "overpass api error", "rate limit", "503", "502", "504", 
-        "internal server error", "connection refused"
-      ];
-      const isTechnicalError = !result.success && result.error && technicalErrorKeywords.some(k => result.error.toLowerCase().includes(k));
+      const isTechnicalError = !result.success && result.error && TECHNICAL_ERROR_PATTERN.test(result.error);
 
       if (isTechnicalError && attempts < maxRetries - 1) {
         throw new Error(result.error); // Trigger retry
@@ -117,8 +124,7 @@ export async function executeToolWithContext(
       console.log(`Tool ${tool_name} returned success: false, triggering re-plan...`);
       
       // Determine error type (Phase 1.1)
-      const validationKeywords = ['invalid', 'missing', 'type', 'validation'];
-      const errorType = result.error && validationKeywords.some(k => result.error.toLowerCase().includes(k))
+      const errorType = result.error && VALIDATION_ERROR_PATTERN.test(result.error)
         ? "validation"
         : "logic";
 
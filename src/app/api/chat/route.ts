@@ -81,7 +81,9 @@ export async function POST(req: Request) {
 
     // Step 2: Semantic Memory & Proactive Retrieval (Phase 2 Upgrade)
     const getRelevantFailures = function(text: string, logs: any[]) {
-      const keywords = text.toLowerCase().split(/\W+/).filter(w => w.length > 3);
+      const keywords = Array.from(new Set(text.toLowerCase().split(/\W+/).filter(w => w.length > 3)));
+      // No keywords means no overlap is possible; skip serializing every failed step
+      if (keywords.length === 0) return [];
       const failures: string[] = [];
       for (const log of logs) {
         if (log.steps) {
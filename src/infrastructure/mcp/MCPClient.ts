@@ -6,6 +6,9 @@ import { z } from "zod";
 import { mapJsonSchemaToZod } from "../../lib/engine/schema-utils";
 import { mcpConfig } from "../../lib/mcp-config";
 
+// Tool name fragments that mark a remote tool as side-effecting.
+const CONFIRMATION_PATTERN = /book|pay|reserve|buy|send|schedule|delete|remove|dispatch|deliver/i;
+
 /**
  * MCPClient connects to remote MCP servers and maps their tools 
  * to the engine's internal ToolDefinition format.
@@ -95,11 +98,7 @@ export class MCPClient {
     // Attempt to derive return_schema from non-standard MCP metadata if available
     const return_schema = (tool as any).outputSchema || (tool as any).returnSchema || {};
     
-    const confirmationKeywords = ["book", "pay", "reserve", "buy", "send", "schedule", "delete", "remove", "dispatch", "deliver"];
-    const requires_confirmation = 
-      confirmationKeywords.some(keyword => tool.name.toLowerCase().includes(keyword)) ||
-      tool.name.toLowerCase().startsWith("delete_") ||
-      tool.name.toLowerCase().startsWith("remove_");
+    const requires_confirmation = CONFIRMATION_PATTERN.test(tool.name);
 
     // Semantic Parameter Aliases: Bridge common LLM naming to specific tool requirements
     const parameter_aliases: Record<string, string> = {
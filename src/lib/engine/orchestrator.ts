@@ -27,6 +27,9 @@ import { saveExecutionState, getMemoryClient } from "./memory";
 import { MCPClient } from "../../infrastructure/mcp/MCPClient";
 import { validateOutputAgainstConstraints } from "./intent";
 
+// Tool name fragments that mark a step as an action subject to semantic guardrails
+const ACTION_STEP_PATTERN = /book|reserve|schedule/i;
+
 // ============================================================================
 // SCORE OUTCOME
 // Mark plan as OPTIMAL if all steps succeeded
@@ -240,9 +243,7 @@ async function executeStep(
       }
 
       // Task 3: Semantic Guardrail Layer - Verify parameters match qualitative constraints
-      const isActionStep = step.tool_name.toLowerCase().includes("book") || 
-                           step.tool_name.toLowerCase().includes("reserve") || 
-                           step.tool_name.toLowerCase().includes("schedule");
+      const isActionStep = ACTION_STEP_PATTERN.test(step.tool_name);
       
       if (isActionStep && state.intent?.parameters) {
         // Extract qualitative constraints from intent (e.g., "romantic", "cheap")